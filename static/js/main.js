@@ -9,15 +9,38 @@ document.addEventListener('DOMContentLoaded', () => {
     const remoteOnlyCheckbox = document.getElementById('remote-only');
     const fulltimeOnlyCheckbox = document.getElementById('fulltime-only');
     const refreshBtn = document.getElementById('refresh-btn');
-    const jobsContainer = document.getElementById('jobs-container');
+    const jobFilterInput = document.getElementById('job-filter-input');
+    const jobsViewport = document.getElementById('jobs-viewport');
+    const jobsWindow = document.getElementById('jobs-window');
     const jobCountElement = document.getElementById('job-count');
     const loadingElement = document.getElementById('loading');
     const noJobsElement = document.getElementById('no-jobs');
+    const jobCardTemplate = document.getElementById('job-card-template');
+    
+    // Rows rendered above and below the visible area to keep scrolling smooth
+    const OVERSCAN_ROWS = 2;
+    const FILTER_DEBOUNCE_MS = 150;
+    const HOURS_PER_YEAR = 2080;
     
     // State
     let searchTerms = [];
     let lastFetchTime = null;
-    let jobsData = [];
+    
+    // In-memory job store: records keyed by id plus a newest-first ordering.
+    // Each record caches the derived values the filters need so filtering
+    // never touches the DOM or re-parses job fields.
+    const jobStore = {
+        byId: new Map(),
+        sorted: []
+    };
+    let filteredJobs = [];
+    
+    // Virtualized list state
+    const renderedCards = new Map();
+    let layout = null;
+    let renderedRange = null;
+    let renderScheduled = false;
+    let filterTimer = null;
     
     // Initialize
     init();
@@ -33,6 +56,21 @@ document.addEventListener('DOMContentLoaded', () => {
     });
     refreshBtn.addEventListener('click', refreshJobs);
     
+    // Filters are applied locally against the store, no refetch needed
+    remoteOnlyCheckbox.addEventListener('change', applyFilters);
+    fulltimeOnlyCheckbox.addEventListener('change', applyFilters);
+    timePeriodSelect.addEventListener('change', applyFilters);
+    minSalaryInput.addEventListener('input', scheduleApplyFilters);
+    jobFilterInput.addEventListener('input', scheduleApplyFilters);
+    
+    window.addEventListener('scroll', scheduleRender, { passive: true });
+    window.addEventListener('resize', () => {
+        // Re-measure columns and row height, even if the range doesn't change
+        layout = null;
+        renderedRange = null;
+        scheduleRender();
+    });
+    
     // Functions
     async function init() {
         try {
@@ -58,12 +96,14 @@ document.addEventListener('DOMContentLoaded', () => {
             searchTerms.push(term);
             searchTermInput.value = '';
             renderSearchTerms();
+            applyFilters();
         }
     }
     
     function removeSearchTerm(term) {
         searchTerms = searchTerms.filter(t => t !== term);
         renderSearchTerms();
+        applyFilters();
     }
     
     function renderSearchTerms() {
@@ -90,36 +130,34 @@ document.addEventListener('DOMContentLoaded', () => {
     }
     
     async function fetchJobs() {
-        showLoading();
+        if (jobStore.sorted.length === 0) {
+            showLoading();
+        }
         
         try {
-            // Build query params
+            // Fetch the widest dataset once; search terms, salary, remote,
+            // full-time and time period are all narrowed down client-side.
             const params = new URLSearchParams();
-            if (searchTerms.length > 0) {
-                params.append('query', searchTerms.join(','));
-            }
-            params.append('min_salary', minSalaryInput.value);
-            params.append('remote_only', remoteOnlyCheckbox.checked);
-            params.append('fulltime_only', fulltimeOnlyCheckbox.checked);
-            params.append('time_period', timePeriodSelect.value);
+            params.append('remote_only', false);
+            params.append('fulltime_only', false);
+            params.append('time_period', getMaxTimePeriod());
             
             // Fetch jobs
             const response = await fetch(`/api/jobs?${params.toString()}`);
             const newJobs = await response.json();
             
-            // Update jobs data
-            const oldJobIds = new Set(jobsData.map(job => job.id));
-            jobsData = newJobs;
-            
-            // Render jobs
-            renderJobs(jobsData, oldJobIds);
+            // Merge into the store and re-render only what changed
+            mergeJobs(newJobs);
+            applyFilters();
             
             // Update last fetch time
             lastFetchTime = new Date();
             updateLastFetchTime();
         } catch (error) {
             console.error('Error fetching jobs:', error);
-            showNoJobs();
+            if (jobStore.sorted.length === 0) {
+                showNoJobs();
+            }
         }
     }
     
@@ -149,12 +187,93 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     }
     
-    function renderJobs(jobs, oldJobIds) {
+    function mergeJobs(jobs) {
+        const incomingIds = new Set();
+        
+        jobs.forEach(job => {
+            incomingIds.add(job.id);
+            const signature = JSON.stringify(job);
+            const existing = jobStore.byId.get(job.id);
+            
+            if (existing && existing.signature === signature) {
+                if (existing.isNew) {
+                    // Rebuild the card without its NEW badge
+                    existing.isNew = false;
+                    removeRenderedCard(job.id);
+                }
+                return;
+            }
+            
+            jobStore.byId.set(job.id, createJobRecord(job, signature, !existing));
+            // Drop the stale card so it is rebuilt with the new data
+            removeRenderedCard(job.id);
+        });
+        
+        // Forget jobs the server no longer returns
+        for (const id of jobStore.byId.keys()) {
+            if (!incomingIds.has(id)) {
+                jobStore.byId.delete(id);
+                removeRenderedCard(id);
+            }
+        }
+        
+        // Sort jobs by date (newest first)
+        jobStore.sorted = Array.from(jobStore.byId.values());
+        jobStore.sorted.sort((a, b) => b.postedAt - a.postedAt);
+    }
+    
+    function createJobRecord(job, signature, isNew) {
+        return {
+            job,
+            signature,
+            isNew,
+            postedAt: new Date(job.date_posted).getTime(),
+            annualSalary: parseAnnualSalary(job.salary),
+            titleText: (job.title || '').toLowerCase(),
+            searchText: [job.title, job.company, job.location, job.description]
+                .filter(Boolean)
+                .join(' ')
+                .toLowerCase()
+        };
+    }
+    
+    function scheduleApplyFilters() {
+        clearTimeout(filterTimer);
+        filterTimer = setTimeout(applyFilters, FILTER_DEBOUNCE_MS);
+    }
+    
+    function applyFilters() {
+        clearTimeout(filterTimer);
+        
+        const terms = searchTerms.map(term => term.toLowerCase());
+        const query = jobFilterInput.value.trim().toLowerCase();
+        const minSalary = parseInt(minSalaryInput.value) || 0;
+        const remoteOnly = remoteOnlyCheckbox.checked;
+        const fulltimeOnly = fulltimeOnlyCheckbox.checked;
+        const dateThreshold = Date.now() - parseInt(timePeriodSelect.value) * 24 * 60 * 60 * 1000;
+        
+        filteredJobs = jobStore.sorted.filter(record => {
+            if (record.postedAt < dateThreshold) return false;
+            if (remoteOnly && !record.job.is_remote) return false;
+            if (fulltimeOnly && !record.job.is_fulltime) return false;
+            // Jobs without a parseable salary are kept rather than hidden
+            if (record.annualSalary !== null && record.annualSalary < minSalary) return false;
+            if (terms.length > 0 && !terms.some(term => record.titleText.includes(term))) return false;
+            if (query && !record.searchText.includes(query)) return false;
+            return true;
+        });
+        
+        renderJobs();
+    }
+    
+    function renderJobs() {
         // Update job count
-        jobCountElement.textContent = `${jobs.length} jobs found`;
+        jobCountElement.textContent = `${filteredJobs.length} jobs found`;
         
         // Show/hide loading and no jobs messages
-        if (jobs.length === 0) {
+        if (filteredJobs.length === 0) {
+            clearRenderedCards();
+            jobsViewport.style.height = '0px';
             showNoJobs();
             return;
         }
@@ -163,52 +282,160 @@ document.addEventListener('DOMContentLoaded', () => {
         loadingElement.classList.add('d-none');
         noJobsElement.classList.add('d-none');
         
-        // Clear jobs container (except for loading and no jobs elements)
-        const jobCards = jobsContainer.querySelectorAll('.job-card-container');
-        jobCards.forEach(card => card.remove());
+        // Force the window to be recomputed for the new result set
+        renderedRange = null;
+        renderWindow();
+    }
+    
+    function scheduleRender() {
+        if (renderScheduled) return;
+        renderScheduled = true;
+        requestAnimationFrame(() => {
+            renderScheduled = false;
+            renderWindow();
+        });
+    }
+    
+    function renderWindow() {
+        if (filteredJobs.length === 0) return;
         
-        // Get job card template
-        const template = document.getElementById('job-card-template');
+        const needsMeasure = layout === null;
+        const { columns, rowHeight, gutter } = layout || { columns: 1, rowHeight: 320, gutter: 24 };
+        const rowPitch = rowHeight + gutter;
+        const totalRows = Math.ceil(filteredJobs.length / columns);
+        jobsViewport.style.height = `${totalRows * rowPitch - gutter}px`;
         
-        // Sort jobs by date (newest first)
-        jobs.sort((a, b) => new Date(b.date_posted) - new Date(a.date_posted));
+        // Work out which rows intersect the browser viewport
+        const viewportTop = jobsViewport.getBoundingClientRect().top;
+        const firstVisibleRow = Math.floor(Math.max(0, -viewportTop) / rowPitch);
+        const lastVisibleRow = Math.ceil(Math.max(0, window.innerHeight - viewportTop) / rowPitch);
+        const startRow = Math.max(0, firstVisibleRow - OVERSCAN_ROWS);
+        const endRow = Math.min(totalRows, lastVisibleRow + OVERSCAN_ROWS);
+        const start = startRow * columns;
+        const end = Math.min(filteredJobs.length, endRow * columns);
         
-        // Render each job
-        jobs.forEach(job => {
-            const isNew = !oldJobIds.has(job.id);
-            const jobElement = template.content.cloneNode(true);
-            const jobCard = jobElement.querySelector('.col-md-6');
-            jobCard.classList.add('job-card-container');
-            
-            // Add new badge if job is new
-            if (isNew) {
-                const newBadge = document.createElement('div');
-                newBadge.className = 'badge bg-danger new-job-badge pulse-animation';
-                newBadge.textContent = 'NEW';
-                jobCard.querySelector('.job-card').appendChild(newBadge);
+        if (renderedRange && renderedRange.start === start && renderedRange.end === end) {
+            return;
+        }
+        renderedRange = { start, end };
+        
+        jobsWindow.style.transform = `translateY(${startRow * rowPitch}px)`;
+        
+        // Remove cards that scrolled out of the window
+        const visible = filteredJobs.slice(start, end);
+        const visibleIds = new Set(visible.map(record => record.job.id));
+        for (const id of renderedCards.keys()) {
+            if (!visibleIds.has(id)) {
+                removeRenderedCard(id);
+            }
+        }
+        
+        // Reuse existing cards and insert new ones in order
+        let cursor = jobsWindow.firstElementChild;
+        visible.forEach(record => {
+            let card = renderedCards.get(record.job.id);
+            if (!card) {
+                card = createJobCard(record);
+                renderedCards.set(record.job.id, card);
+            }
+            if (card === cursor) {
+                cursor = cursor.nextElementSibling;
+            } else {
+                jobsWindow.insertBefore(card, cursor);
             }
-            
-            // Fill in job details
-            jobCard.querySelector('.job-title').textContent = job.title;
-            jobCard.querySelector('.company-name').textContent = job.company;
-            jobCard.querySelector('.location-badge').textContent = job.location;
-            jobCard.querySelector('.salary-badge').textContent = job.salary;
-            
-            // Format date
-            const datePosted = new Date(job.date_posted);
-            const timeAgo = getTimeAgo(datePosted);
-            jobCard.querySelector('.date-badge').textContent = timeAgo;
-            
-            // Set description
-            jobCard.querySelector('.job-description').textContent = job.description;
-            
-            // Set link
-            const link = jobCard.querySelector('.job-link');
-            link.href = job.url;
-            
-            // Add to jobs container
-            jobsContainer.appendChild(jobElement);
         });
+        
+        if (needsMeasure && measureLayout()) {
+            renderedRange = null;
+            renderWindow();
+        }
+    }
+    
+    function measureLayout() {
+        const card = jobsWindow.firstElementChild;
+        if (!card || card.offsetWidth === 0) return false;
+        
+        layout = {
+            columns: Math.max(1, Math.round(jobsWindow.clientWidth / card.offsetWidth)),
+            rowHeight: card.offsetHeight,
+            gutter: parseFloat(getComputedStyle(card).marginTop) || 0
+        };
+        return true;
+    }
+    
+    function createJobCard(record) {
+        const job = record.job;
+        const jobElement = jobCardTemplate.content.cloneNode(true);
+        const jobCard = jobElement.querySelector('.col-md-6');
+        jobCard.classList.add('job-card-container');
+        
+        // Add new badge if job is new
+        if (record.isNew) {
+            const newBadge = document.createElement('div');
+            newBadge.className = 'badge bg-danger new-job-badge pulse-animation';
+            newBadge.textContent = 'NEW';
+            jobCard.querySelector('.job-card').appendChild(newBadge);
+        }
+        
+        // Fill in job details
+        jobCard.querySelector('.job-title').textContent = job.title;
+        jobCard.querySelector('.company-name').textContent = job.company;
+        jobCard.querySelector('.location-badge').textContent = job.location;
+        jobCard.querySelector('.salary-badge').textContent = job.salary;
+        
+        // Format date
+        const timeAgo = getTimeAgo(new Date(record.postedAt));
+        jobCard.querySelector('.date-badge').textContent = timeAgo;
+        
+        // Set description
+        jobCard.querySelector('.job-description').textContent = job.description;
+        
+        // Set link
+        const link = jobCard.querySelector('.job-link');
+        link.href = job.url;
+        
+        return jobCard;
+    }
+    
+    function removeRenderedCard(id) {
+        const card = renderedCards.get(id);
+        if (card) {
+            card.remove();
+            renderedCards.delete(id);
+            renderedRange = null;
+        }
+    }
+    
+    function clearRenderedCards() {
+        renderedCards.forEach(card => card.remove());
+        renderedCards.clear();
+        renderedRange = null;
+    }
+    
+    function getMaxTimePeriod() {
+        return Math.max(...Array.from(timePeriodSelect.options, option => parseInt(option.value)));
+    }
+    
+    function parseAnnualSalary(salary) {
+        if (!salary) return null;
+        
+        // Use the top of the advertised range, e.g. "$180,000 - $220,000 a year".
+        // Only dollar amounts count, so things like "401k" are ignored.
+        const amountPattern = /\$\s*(\d+(?:\.\d+)?)\s*(k)?(?:\s*-\s*\$?\s*(\d+(?:\.\d+)?)\s*(k)?)?/gi;
+        const amounts = [];
+        for (const match of salary.replace(/,/g, '').matchAll(amountPattern)) {
+            amounts.push(parseFloat(match[1]) * (match[2] ? 1000 : 1));
+            if (match[3]) {
+                amounts.push(parseFloat(match[3]) * (match[4] ? 1000 : 1));
+            }
+        }
+        if (amounts.length === 0) return null;
+        
+        const amount = Math.max(...amounts);
+        if (/\bhour|\bhrs?\b/i.test(salary)) return amount * HOURS_PER_YEAR;
+        if (/\bweek|\bwk\b/i.test(salary)) return amount * 52;
+        if (/\bmonth|\bmo\b/i.test(salary)) return amount * 12;
+        return amount;
     }
     
     function showLoading() {